@@ -111,6 +111,36 @@ class SchneiderVsdConfig(config.Schema):
         description="Choose which drive events post to the notifications channel.",
     )
 
+    # Adaptive polling — back off the Modbus poll rate when the drive has
+    # been idle and unchanged for a few cycles. Must stay well under the
+    # drive's Modbus timeout (TTO) or the comms watchdog trips.
+    idle_poll_interval = config.Number(
+        "Idle Poll Interval (seconds)",
+        default=15.0,
+        description=(
+            "Poll interval used once the drive has been idle and unchanged "
+            "for several cycles. Snaps back to the normal rate on any "
+            "change or user command. Capped at half the Modbus timeout so "
+            "the drive's comms watchdog never trips."
+        ),
+        hidden=True,
+    )
+
+    # Telemetry cadence — operating values (frequency, current, power, etc.)
+    # are pushed to tags at this interval rather than every poll cycle.
+    # State/fault transitions always publish immediately.
+    telemetry_interval = config.Number(
+        "Telemetry Interval (seconds)",
+        default=30.0,
+        description=(
+            "How often operating values are published to tags. Polling "
+            "continues every cycle regardless; this only throttles "
+            "steady-state telemetry. State and fault changes publish "
+            "immediately."
+        ),
+        hidden=True,
+    )
+
     # Comms watchdog — the drive faults on Modbus silence beyond this timeout.
     # Factory default is 10 s which is too tight for a typical container
     # restart. Max accepted by the drive is 30 s.
@@ -22,6 +22,15 @@ _LSP_LOCKED_LABEL = '$tag.app().lsp_locked_label:string:"Drive locked at a singl
 _MOTOR_FAULT_LABEL = '$tag.app().motor_fault_label:string:"Motor Fault"'
 _APP_DISPLAY_NAME = '$tag.app().app_display_name:string:"Schneider VSD"'
 
+# Mains voltage colour ranges are the only config-independent set, so they
+# are built once at import — covers EU 400 V and AU/NZ 415 V systems with
+# ±~10 % tolerance. Anything outside 360–440 V is abnormal.
+_MAINS_VOLTAGE_RANGES = [
+    ui.Range(None, 0, 360, ui.Colour.red),
+    ui.Range(None, 360, 440, ui.Colour.green),
+    ui.Range(None, 440, 600, ui.Colour.red),
+]
+
 
 class SchneiderVsdUI(ui.UI, display_name=_APP_DISPLAY_NAME):
 
@@ -184,10 +193,5 @@ class SchneiderVsdUI(ui.UI, display_name=_APP_DISPLAY_NAME):
             ui.Range(None, max_kw * op_pct, max_kw * 1.5, ui.Colour.red),
         ]
 
-        # Colour ranges for mains voltage — covers EU 400 V and AU/NZ 415 V
-        # systems with ±~10 % tolerance. Anything outside 360–440 V is abnormal.
-        self.mains_voltage.ranges = [
-            ui.Range(None, 0, 360, ui.Colour.red),
-            ui.Range(None, 360, 440, ui.Colour.green),
-            ui.Range(None, 440, 600, ui.Colour.red),
-        ]
+        # Colour ranges for mains voltage — static, shared from module scope
+        self.mains_voltage.ranges = _MAINS_VOLTAGE_RANGES
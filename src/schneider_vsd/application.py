@@ -1,6 +1,8 @@
 """Schneider VSD control application."""
 
+import asyncio
 import logging
+from time import monotonic
 
 from pydoover import ui
 from pydoover.docker import Application
@@ -14,6 +16,11 @@ from .vsd.base import VsdStatus
 
 log = logging.getLogger(__name__)
 
+# Display labels derived from HMIS state names, filled lazily — the set of
+# names is small and fixed, so each label is formatted once per process
+# instead of re-running replace/title every cycle.
+_STATE_LABELS: dict[str, str] = {}
+
 
 class SchneiderVsdApplication(Application):
     config: SchneiderVsdConfig
@@ -25,6 +32,19 @@ class SchneiderVsdApplication(Application):
 
     loop_target_period = 5
 
+    # Consecutive unchanged idle polls before backing off to the slower
+    # idle poll interval.
+    IDLE_STABLE_POLLS = 3
+
+    # Quiet window for coalescing rapid frequency-setpoint changes into a
+    # single Modbus write (latest value wins).
+    FREQ_DEBOUNCE_S = 0.3
+
+    # A warned value must drop below this fraction of its threshold before
+    # the warning re-arms — readings oscillating around the threshold
+    # would otherwise notify on every crossing.
+    WARNING_CLEAR_RATIO = 0.95
+
     async def setup(self):
         vsd_class = get_vsd_class(self.config.vsd_type.value)
         self.vsd = vsd_class(
@@ -45,6 +65,43 @@ class SchneiderVsdApplication(Application):
         # "started" on boot with a drive already running.
         self._prev_running: bool | None = None
         self._prev_faulted: bool | None = None
+        # Last value pushed per tag, keyed by attr name — lets the tag
+        # update paths skip writes for values that haven't changed.
+        self._pushed_tags: dict[str, object] = {}
+        # Operating values publish on a slower cadence than the poll loop;
+        # zero means the first connected cycle always publishes.
+        self._last_telemetry_time: float = 0.0
+        # Debounced frequency setpoint — written by the UI handler, flushed
+        # to the drive by _flush_freq after the quiet window.
+        self._pending_freq: float | None = None
+        self._freq_flush_task: asyncio.Task | None = None
+
+        # Config snapshot — doover config is fixed for the life of the
+        # container (changes redeploy the app), so hot-path values are
+        # cached as plain attributes instead of re-walking the config
+        # descriptor chain every cycle.
+        self._terminal_mode_label: str = self.config.terminal_mode_label.value
+        self._max_power_kw: float = self.config.max_power_kw.value
+        self._overpower_threshold_kw: float = (
+            self._max_power_kw * (self.config.overpower_threshold.value / 100.0)
+        )
+        self._overtemp_threshold: float = self.config.overtemperature_threshold.value
+        self._telemetry_interval: float = self.config.telemetry_interval.value
+        self._max_frequency: float = self.config.max_frequency.value
+
+        # Adaptive polling: back off while the drive is idle and unchanged,
+        # snap back on any change or user command. Capped at half the
+        # drive's Modbus timeout so the comms watchdog (TTO) never trips.
+        self._base_poll_period: float = self.loop_target_period
+        self._idle_poll_interval: float = min(
+            self.config.idle_poll_interval.value,
+            self.config.modbus_timeout_seconds.value / 2,
+        )
+        self._stable_count: int = 0
+        self._last_fingerprint: tuple | None = None
+        # Inputs behind the last computed visibility pairs — unchanged
+        # inputs short-circuit the whole visibility pass.
+        self._visibility_fp: tuple | None = None
 
     def _selected_mode(self) -> str | None:
         # Not a @property: pydoover's rpc.register_handlers uses
@@ -58,13 +115,13 @@ class SchneiderVsdApplication(Application):
     def _is_terminal_mode(self) -> bool:
         """True when a terminal mode is configured AND currently selected."""
         return (
-            bool(self.config.terminal_mode_label.value)
+            bool(self._terminal_mode_label)
             and self._selected_mode() == "terminal_control"
         )
 
     def _remote_control_allowed(self) -> bool:
         """True when the user can issue start/stop/speed commands."""
-        if self.config.terminal_mode_label.value:
+        if self._terminal_mode_label:
             return self._selected_mode() == "user_control"
         return True
 
@@ -92,8 +149,11 @@ class SchneiderVsdApplication(Application):
             if await self.vsd.run_setup():
                 log.info("Deferred configuration complete")
 
-        # Push all values to tags
-        await self._update_tags(status)
+        # Push all values to tags. Power is derived once here and shared
+        # with the warning checks — OPR is signed % of motor nominal,
+        # translated to kW via the configured rating.
+        power_kw = status.power_pct / 100.0 * self._max_power_kw
+        await self._update_tags(status, power_kw)
 
         # Enforce operating mode on the VSD hardware each cycle
         await self._enforce_operating_mode()
@@ -103,11 +163,61 @@ class SchneiderVsdApplication(Application):
             await self.vsd.manage_operating_state()
 
         # Warning checks (always active regardless of mode)
-        await self._check_warnings(status)
+        await self._check_warnings(status, power_kw)
 
         # Event notifications — fire on state transitions if configured
         await self._check_event_notifications(status)
 
+        # Adjust poll cadence last, off the fully-processed snapshot
+        self._adapt_poll_period(status)
+
+    # ------------------------------------------------------------------
+    # Adaptive polling
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _status_fingerprint(status: VsdStatus) -> tuple:
+        """Cheap change-detection tuple over the fields that matter.
+
+        Values are rounded to display precision so measurement noise
+        doesn't defeat the idle detection.
+        """
+        return (
+            status.hmis_state,
+            status.is_faulted,
+            status.fault_code,
+            round(status.frequency_hz, 1),
+            round(status.current_amps, 1),
+            status.di_1,
+            status.di_2,
+            status.di_3,
+        )
+
+    def _adapt_poll_period(self, status: VsdStatus):
+        """Back off polling once the drive has been idle and unchanged.
+
+        A running drive always polls at the base rate. Any fingerprint
+        change resets the stability counter and restores the base rate.
+        """
+        fp = self._status_fingerprint(status)
+        if status.is_running or fp != self._last_fingerprint:
+            self._last_fingerprint = fp
+            self._resume_fast_poll()
+            return
+        if self._stable_count < self.IDLE_STABLE_POLLS:
+            self._stable_count += 1
+            if self._stable_count >= self.IDLE_STABLE_POLLS:
+                log.debug(
+                    "Drive idle and unchanged — polling every %.0f s",
+                    self._idle_poll_interval,
+                )
+                self.loop_target_period = self._idle_poll_interval
+
+    def _resume_fast_poll(self):
+        """Restore the base poll rate (on change or user command)."""
+        self._stable_count = 0
+        self.loop_target_period = self._base_poll_period
+
     # ------------------------------------------------------------------
     # Operating mode
     # ------------------------------------------------------------------
@@ -119,7 +229,7 @@ class SchneiderVsdApplication(Application):
         (e.g. float switch). In user control mode the drive is put into
         remote-ready-local so it accepts Modbus commands.
         """
-        if not self.config.terminal_mode_label.value:
+        if not self._terminal_mode_label:
             return  # No mode switching configured
 
         if not self.vsd.is_contactable:
@@ -134,62 +244,108 @@ class SchneiderVsdApplication(Application):
     # Tag updates
     # ------------------------------------------------------------------
 
-    async def _update_tags(self, status: VsdStatus):
-        await self.tags.comms_active.set(True)
-        await self.tags.vsd_state.set(status.hmis_name)
-        await self.tags.vsd_running.set(status.is_running)
-        await self.tags.vsd_faulted.set(status.is_faulted)
-        await self.tags.vsd_fault_code.set(
-            status.fault_code if status.is_faulted else None,
-        )
-        await self.tags.vsd_fault_description.set(
-            status.fault_description if status.is_faulted else None,
-        )
-        await self.tags.vsd_frequency.set(status.frequency_hz)
-        await self.tags.vsd_current.set(status.current_amps)
-        await self.tags.vsd_voltage.set(status.motor_voltage_v)
-        await self.tags.vsd_mains_voltage.set(status.mains_voltage_v)
-        # OPR is signed % of motor nominal; translate to kW via configured rating.
-        power_kw = status.power_pct / 100.0 * self.config.max_power_kw.value
-        await self.tags.vsd_power.set(round(power_kw, 2))
-        await self.tags.vsd_power_pct.set(status.power_pct)
-        await self.tags.vsd_thermal_load.set(status.thermal_load_pct)
-        await self.tags.motor_run_hours.set(round(status.motor_run_hours, 1))
-        await self.tags.di_1.set(status.di_1)
-        await self.tags.di_2.set(status.di_2)
-        await self.tags.di_3.set(status.di_3)
+    def _tag_writes(self, pairs) -> list:
+        """Tag-set coroutines for values that changed since the last push.
+
+        ``pairs`` is an iterable of ``(attr_name, value)``. Values equal to
+        the last pushed value for that tag are skipped, so steady-state
+        cycles issue zero writes for unchanged tags.
+        """
+        writes = []
+        pushed = self._pushed_tags
+        for name, value in pairs:
+            if name in pushed and pushed[name] == value:
+                continue
+            pushed[name] = value
+            writes.append(getattr(self.tags, name).set(value))
+        return writes
+
+    async def _update_tags(self, status: VsdStatus, power_kw: float):
         ai_1, ai_2, ai_3, ai_4, ai_5 = status.ai_values
-        await self.tags.ai_1.set(ai_1)
-        await self.tags.ai_2.set(ai_2)
-        await self.tags.ai_3.set(ai_3)
-        await self.tags.ai_4.set(ai_4)
-        await self.tags.ai_5.set(ai_5)
-
-        await self.tags.app_display_name.set(
-            f"{self.app_display_name} : {self._state_label(status)}"
+        # State/fault edges always publish immediately; steady-state
+        # operating values are throttled to the telemetry interval so a
+        # drive that's just humming along doesn't re-publish every cycle.
+        state_changed = (
+            status.hmis_name != self._pushed_tags.get("vsd_state")
+            or status.is_faulted != self._pushed_tags.get("vsd_faulted")
         )
-        await self._update_ui_visibility(status)
+        now = monotonic()
+        telemetry_due = (
+            state_changed
+            or now - self._last_telemetry_time
+            >= self._telemetry_interval
+        )
+        # One gather instead of ~25 sequential awaits — each .set() is an
+        # independent round-trip, so batching collapses the event-loop
+        # scheduling and IPC hops into a single concurrent burst.
+        pairs = [
+            ("comms_active", True),
+            ("vsd_state", status.hmis_name),
+            ("vsd_running", status.is_running),
+            ("vsd_faulted", status.is_faulted),
+            ("vsd_fault_code", status.fault_code if status.is_faulted else None),
+            ("vsd_fault_description",
+             status.fault_description if status.is_faulted else None),
+            ("di_1", status.di_1),
+            ("di_2", status.di_2),
+            ("di_3", status.di_3),
+            ("app_display_name",
+             f"{self.app_display_name} : {self._state_label(status)}"),
+        ]
+        if telemetry_due:
+            self._last_telemetry_time = now
+            pairs += [
+                ("vsd_frequency", status.frequency_hz),
+                ("vsd_current", status.current_amps),
+                ("vsd_voltage", status.motor_voltage_v),
+                ("vsd_mains_voltage", status.mains_voltage_v),
+                ("vsd_power", round(power_kw, 2)),
+                ("vsd_power_pct", status.power_pct),
+                ("vsd_thermal_load", status.thermal_load_pct),
+                ("motor_run_hours", round(status.motor_run_hours, 1)),
+                ("ai_1", ai_1),
+                ("ai_2", ai_2),
+                ("ai_3", ai_3),
+                ("ai_4", ai_4),
+                ("ai_5", ai_5),
+            ]
+        # Visibility pairs ride in the same gather — tag values and UI
+        # visibility are derived from the same status in one pass.
+        pairs += self._visibility_pairs(status)
+        writes = self._tag_writes(pairs)
+        if writes:
+            await asyncio.gather(*writes)
 
     async def _set_disconnected(self):
-        await self.tags.comms_active.set(False)
-        await self.tags.vsd_state.set("disconnected")
-        await self.tags.app_display_name.set(
-            f"{self.app_display_name} : {self._state_label(None)}"
-        )
-        await self._update_ui_visibility(None)
+        self._resume_fast_poll()
+        pairs = [
+            ("comms_active", False),
+            ("vsd_state", "disconnected"),
+            ("app_display_name",
+             f"{self.app_display_name} : {self._state_label(None)}"),
+        ]
+        pairs += self._visibility_pairs(None)
+        writes = self._tag_writes(pairs)
+        if writes:
+            await asyncio.gather(*writes)
 
     @staticmethod
     def _state_label(status: VsdStatus | None) -> str:
         if status is None or not status.contactable:
             return "No Comms"
-        return status.hmis_name.replace("_", " ").title()
+        name = status.hmis_name
+        label = _STATE_LABELS.get(name)
+        if label is None:
+            label = _STATE_LABELS[name] = name.replace("_", " ").title()
+        return label
 
-    async def _update_ui_visibility(self, status: VsdStatus | None) -> None:
-        """Drive conditional UI visibility via tag-backed resolvers.
+    def _visibility_pairs(self, status: VsdStatus | None) -> list:
+        """Tag pairs driving conditional UI visibility via tag-backed resolvers.
 
         Element.hidden is bound to $tag.app().hide_<name> in app_ui.py — the
         schema is only published once at setup, so we can't mutate element
-        attributes at runtime. Tag writes re-render each cycle.
+        attributes at runtime. Tag writes re-render each cycle. Returned as
+        (attr_name, value) pairs so callers fold them into their own batch.
         """
         contactable = status is not None and status.contactable
         in_terminals = self._is_terminal_mode()
@@ -211,31 +367,40 @@ class SchneiderVsdApplication(Application):
             and status.low_speed_hz == status.high_speed_hz
         )
 
-        await self.tags.hide_frequency_setpoint.set(
-            in_terminals or not contactable or started_locally or speed_locked
-        )
-        await self.tags.hide_start_button.set(
-            in_terminals or is_running or not contactable
+        # Every hide flag and label below derives from exactly these
+        # inputs — if none changed, skip building and diffing the pairs.
+        fp = (
+            contactable, in_terminals, is_running, is_faulted,
+            started_locally, speed_locked,
+            status.low_speed_hz if speed_locked else 0.0,
+            status.fault_description if is_faulted else "",
         )
-        await self.tags.hide_stop_button.set(
-            in_terminals or not is_running or not contactable
-        )
-        await self.tags.hide_reset_fault_button.set(not is_faulted)
-
-        await self.tags.hide_no_comms_warning.set(contactable)
-        await self.tags.hide_motor_fault_warning.set(not is_faulted)
-        await self.tags.hide_local_run_warning.set(not started_locally)
-        await self.tags.hide_lsp_locked_warning.set(not speed_locked)
+        if fp == self._visibility_fp:
+            return []
+        self._visibility_fp = fp
+
+        pairs = [
+            ("hide_frequency_setpoint",
+             in_terminals or not contactable or started_locally or speed_locked),
+            ("hide_start_button", in_terminals or is_running or not contactable),
+            ("hide_stop_button", in_terminals or not is_running or not contactable),
+            ("hide_reset_fault_button", not is_faulted),
+            ("hide_no_comms_warning", contactable),
+            ("hide_motor_fault_warning", not is_faulted),
+            ("hide_local_run_warning", not started_locally),
+            ("hide_lsp_locked_warning", not speed_locked),
+        ]
         if speed_locked:
-            await self.tags.lsp_locked_label.set(
+            pairs.append(("lsp_locked_label",
                 f"Drive is locked at {status.low_speed_hz:.0f} Hz "
                 f"(LSP equals HSP). Lower LSP on the drive panel to "
                 f"enable remote speed control."
-            )
+            ))
         if is_faulted:
             fault_desc = (status.fault_description or "").strip()
             label = f"Motor Fault: {fault_desc}" if fault_desc else "Motor Fault"
-            await self.tags.motor_fault_label.set(label)
+            pairs.append(("motor_fault_label", label))
+        return pairs
 
     # ------------------------------------------------------------------
     # Notifications
@@ -269,11 +434,9 @@ class SchneiderVsdApplication(Application):
     # Warnings
     # ------------------------------------------------------------------
 
-    async def _check_warnings(self, status: VsdStatus):
-        max_kw = self.config.max_power_kw.value
-        op_threshold = max_kw * (self.config.overpower_threshold.value / 100.0)
-        ot_threshold = self.config.overtemperature_threshold.value
-        power_kw = status.power_pct / 100.0 * max_kw
+    async def _check_warnings(self, status: VsdStatus, power_kw: float):
+        op_threshold = self._overpower_threshold_kw
+        ot_threshold = self._overtemp_threshold
 
         if power_kw > op_threshold:
             if not self._warned_overpower:
@@ -290,7 +453,7 @@ class SchneiderVsdApplication(Application):
                     ),
                     severity=NotificationSeverity.Warn,
                 )
-        else:
+        elif power_kw < op_threshold * self.WARNING_CLEAR_RATIO:
             self._warned_overpower = False
 
         if status.thermal_load_pct > ot_threshold:
@@ -308,7 +471,7 @@ class SchneiderVsdApplication(Application):
                     ),
                     severity=NotificationSeverity.Warn,
                 )
-        else:
+        elif status.thermal_load_pct < ot_threshold * self.WARNING_CLEAR_RATIO:
             self._warned_overtemperature = False
 
     async def _check_event_notifications(self, status: VsdStatus):
@@ -358,65 +521,93 @@ class SchneiderVsdApplication(Application):
     async def on_mode_change(self, ctx, value):
         if value is None:
             return
-        label = self.config.terminal_mode_label.value or "Terminal Control"
+        label = self._terminal_mode_label or "Terminal Control"
         if value == "terminal_control":
             log.info("Switching to terminal mode (%s)", label)
         else:
             log.info("Switching to user control")
 
+    def _guard_remote(self, action: str, require_mode: bool = True) -> bool:
+        """Shared precondition check for the UI command handlers.
+
+        Returns True when the command may proceed; otherwise logs the
+        rejection reason. Fault reset passes require_mode=False since it's
+        allowed from any operating mode.
+        """
+        if require_mode and not self._remote_control_allowed():
+            log.warning("%s rejected — switch to User Control mode first", action)
+            return False
+        if not self.vsd.is_contactable:
+            log.warning("%s rejected — VSD not contactable", action)
+            return False
+        return True
+
     @ui.handler("start_button")
     async def on_start(self, ctx, value):
         await ctx.set_value(None)
-        if not self._remote_control_allowed():
-            log.warning("Start rejected — switch to User Control mode first")
+        if not self._guard_remote("Start"):
             return
-        if not self.vsd.is_contactable:
-            log.warning("Start rejected — VSD not contactable")
-            return
-        # Push the speed setpoint to the drive before asserting RUN — otherwise
-        # the drive sits in HMIS=2 (ready) with RUN latched but no reference.
+        # The speed setpoint rides along with the RUN command in one
+        # transaction — otherwise the drive sits in HMIS=2 (ready) with
+        # RUN latched but no reference.
         setpoint = self.ui_manager.get_value("frequency_setpoint")
         try:
             setpoint = float(setpoint) if setpoint is not None else 0.0
         except (TypeError, ValueError):
             setpoint = 0.0
         if setpoint <= 0:
-            setpoint = self.config.max_frequency.value
+            setpoint = self._max_frequency
             log.info("Frequency setpoint unset; defaulting to %.1f Hz", setpoint)
-        await self.vsd.set_target_freq(setpoint)
         log.info("Start command received")
-        await self.vsd.start_motor()
+        await self.vsd.start_motor(setpoint)
+        self._resume_fast_poll()
 
     @ui.handler("stop_button")
     async def on_stop(self, ctx, value):
         await ctx.set_value(None)
-        if not self._remote_control_allowed():
-            log.warning("Stop rejected — switch to User Control mode first")
-            return
-        if not self.vsd.is_contactable:
-            log.warning("Stop rejected — VSD not contactable")
+        if not self._guard_remote("Stop"):
             return
         log.info("Stop command received")
         await self.vsd.stop_motor()
+        self._resume_fast_poll()
 
     @ui.handler("reset_fault_button")
     async def on_reset_fault(self, ctx, value):
         await ctx.set_value(None)
-        if not self.vsd.is_contactable:
-            log.warning("Fault reset rejected — VSD not contactable")
+        if not self._guard_remote("Fault reset", require_mode=False):
             return
         log.info("Fault reset command received")
         await self.vsd.clear_fault()
+        self._resume_fast_poll()
 
     @ui.handler("frequency_setpoint")
     async def on_frequency_change(self, ctx, value):
         if value is None:
             return
-        if not self._remote_control_allowed():
-            log.warning("Frequency change rejected — switch to User Control mode first")
+        if not self._guard_remote("Frequency change"):
             return
-        if not self.vsd.is_contactable:
-            log.warning("Frequency change rejected — VSD not contactable")
-            return
-        log.info("Frequency setpoint: %.1f Hz", float(value))
-        await self.vsd.set_target_freq(float(value))
+        # Coalesce rapid setpoint changes: record the latest value and let
+        # the flusher emit one Modbus write once the input goes quiet.
+        self._pending_freq = float(value)
+        if self._freq_flush_task is None or self._freq_flush_task.done():
+            self._freq_flush_task = asyncio.create_task(self._flush_freq())
+
+    async def _flush_freq(self):
+        # Latest-wins debounce: keep waiting while new values land inside
+        # the quiet window, then write the final setpoint. The outer loop
+        # re-checks the pending slot after each write — a change that
+        # arrives while set_target_freq is in flight (when the handler
+        # still sees this task as not done) gets flushed too rather than
+        # stranded.
+        while self._pending_freq is not None:
+            while True:
+                pending = self._pending_freq
+                await asyncio.sleep(self.FREQ_DEBOUNCE_S)
+                if self._pending_freq == pending:
+                    break
+            value, self._pending_freq = self._pending_freq, None
+            if value is None:
+                return
+            log.info("Frequency setpoint: %.1f Hz", value)
+            await self.vsd.set_target_freq(value)
+            self._resume_fast_poll()
@@ -1,13 +1,19 @@
 """Thin async Modbus TCP client wrapper.
 
-Provides a connection-per-operation model for reliable communication
-with Schneider Altivar VSDs over Modbus TCP. Each operation opens a
-fresh TCP connection and closes it when done, avoiding stale connection
-issues common with industrial Modbus devices.
+Provides a persistent-connection model for communication with Schneider
+Altivar VSDs over Modbus TCP. The TCP session is opened lazily on first
+use and kept alive across operations; it is only torn down after several
+consecutive Modbus errors or a hard socket error, and the next operation
+transparently reconnects. This avoids paying a 3-way handshake per poll
+while still recovering from the stale-connection issues common with
+industrial Modbus devices.
 """
 
+import asyncio
+import contextlib
 import logging
-import struct
+import socket
+from time import monotonic
 
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
@@ -15,8 +21,64 @@ from pymodbus.exceptions import ModbusException
 log = logging.getLogger(__name__)
 
 
+class _Endpoint:
+    """Shared per-(host, port) connection state.
+
+    Multiple :class:`ModbusTcpConnection` instances — e.g. several slave
+    IDs behind one RTU-over-TCP gateway — share the same endpoint: one TCP
+    session, one lock, one failure count. Gateways commonly cap concurrent
+    TCP connections at 2–4, so a socket per drive doesn't scale.
+    """
+
+    __slots__ = ("client", "lock", "consecutive_failures", "backoff",
+                 "next_attempt_ts", "refs")
+
+    def __init__(self):
+        self.client: AsyncModbusTcpClient | None = None
+        self.lock = asyncio.Lock()
+        self.consecutive_failures = 0
+        # Number of ModbusTcpConnection instances sharing this endpoint —
+        # close() only tears the socket down when the last one leaves.
+        self.refs = 0
+        # Reconnect backoff: grows on each failed connect, resets on
+        # success. While inside the backoff window connect attempts fail
+        # fast so a dead drive isn't hammered with handshakes.
+        self.backoff = 0.0
+        self.next_attempt_ts = 0.0
+
+
+_ENDPOINT_POOL: dict[tuple[str, int], _Endpoint] = {}
+
+
+def _get_endpoint(host: str, port: int) -> _Endpoint:
+    key = (host, port)
+    endpoint = _ENDPOINT_POOL.get(key)
+    if endpoint is None:
+        endpoint = _ENDPOINT_POOL[key] = _Endpoint()
+    return endpoint
+
+
 class ModbusTcpConnection:
-    """Async context manager for a single Modbus TCP connection.
+    """Async context manager for a persistent Modbus TCP connection.
+
+    The first ``async with`` establishes the TCP session; later entries
+    re-use the live socket. Transient Modbus errors (exception responses,
+    timeouts) leave the session open — only ``FAILURE_THRESHOLD``
+    consecutive errors or a hard socket error drop it, after which the
+    next entry reconnects lazily.
+
+    A lock serialises whole ``async with`` blocks, so multi-write command
+    sequences (e.g. the fault-reset pulse) keep the same exclusivity the
+    old connection-per-operation model provided. Read-only callers that
+    don't need that exclusivity can use :meth:`shared` instead, which
+    holds the lock only while establishing the session — individual
+    transactions are then serialised by pymodbus's transaction manager,
+    so a status poll can overlap a command sequence instead of queueing
+    behind it.
+
+    The underlying client, lock, and failure count live in a module-level
+    pool keyed by ``(host, port)``, so connections to different slave IDs
+    on the same endpoint share one TCP session.
 
     Usage::
 
@@ -25,54 +87,214 @@ class ModbusTcpConnection:
             await conn.write_register(8501, 7)
     """
 
+    # Consecutive Modbus-level errors tolerated before the socket is
+    # dropped and rebuilt. Keeps one bad poll from forcing a handshake.
+    FAILURE_THRESHOLD = 3
+
+    __slots__ = ("host", "port", "slave_id", "timeout", "_endpoint")
+
     def __init__(self, host: str, port: int, slave_id: int, timeout: float = 3.0):
         self.host = host
         self.port = port
         self.slave_id = slave_id
         self.timeout = timeout
-        self._client: AsyncModbusTcpClient | None = None
+        self._endpoint = _get_endpoint(host, port)
+        self._endpoint.refs += 1
 
     async def __aenter__(self):
-        self._client = AsyncModbusTcpClient(
+        await self._endpoint.lock.acquire()
+        try:
+            if self._endpoint.client is None or not self._endpoint.client.connected:
+                await self._connect()
+        except BaseException:
+            self._endpoint.lock.release()
+            raise
+        return self
+
+    @contextlib.asynccontextmanager
+    async def shared(self):
+        """Like ``async with self`` but without holding the endpoint lock.
+
+        The lock is taken only long enough to ensure the session is up;
+        the block itself runs unlocked, relying on pymodbus transaction-ID
+        correlation to keep concurrent requests straight. Use for
+        read-only work that shouldn't block (or be blocked by) a command
+        sequence. Writes that must not interleave with other writes keep
+        using the plain context manager.
+        """
+        async with self._endpoint.lock:
+            if self._endpoint.client is None or not self._endpoint.client.connected:
+                await self._connect()
+        try:
+            yield self
+        except (ConnectionError, OSError):
+            self._drop()
+            raise
+
+    # Reconnect backoff bounds: first failed connect waits this long
+    # before the next attempt, doubling up to the cap.
+    BACKOFF_INITIAL = 0.5
+    BACKOFF_MAX = 8.0
+
+    async def _connect(self):
+        if monotonic() < self._endpoint.next_attempt_ts:
+            raise ConnectionError(
+                f"Reconnect to {self.host}:{self.port} backed off for "
+                f"{self._endpoint.next_attempt_ts - monotonic():.1f}s"
+            )
+        self._drop()
+        self._endpoint.client = AsyncModbusTcpClient(
             self.host, port=self.port, timeout=self.timeout,
         )
-        await self._client.connect()
-        if not self._client.connected:
+        await self._endpoint.client.connect()
+        if not self._endpoint.client.connected:
+            self._drop()
+            self._endpoint.backoff = min(
+                self._endpoint.backoff * 2 or self.BACKOFF_INITIAL,
+                self.BACKOFF_MAX,
+            )
+            self._endpoint.next_attempt_ts = monotonic() + self._endpoint.backoff
             raise ConnectionError(f"Failed to connect to {self.host}:{self.port}")
-        return self
+        self._endpoint.consecutive_failures = 0
+        self._endpoint.backoff = 0.0
+        self._endpoint.next_attempt_ts = 0.0
+        self._tune_socket()
+
+    def _drop(self):
+        """Close and discard the underlying client; next entry reconnects."""
+        if self._endpoint.client is not None:
+            self._endpoint.client.close()
+            self._endpoint.client = None
+
+    def _note_failure(self):
+        self._endpoint.consecutive_failures += 1
+        if self._endpoint.consecutive_failures >= self.FAILURE_THRESHOLD:
+            log.warning(
+                "%d consecutive Modbus errors on %s:%d — dropping connection",
+                self._endpoint.consecutive_failures, self.host, self.port,
+            )
+            self._drop()
+            self._endpoint.consecutive_failures = 0
+
+    def _tune_socket(self):
+        """Disable Nagle and enable TCP keepalive on the connected socket.
+
+        Modbus PDUs are far smaller than one MSS; with Nagle enabled each
+        request can sit in the kernel waiting on the peer's delayed ACK
+        (~40 ms added per transaction). Keepalive stops NAT gateways from
+        silently dropping the session between polls. The socket is reached
+        via the asyncio transport, which pymodbus doesn't guarantee across
+        versions — any failure here is non-fatal.
+        """
+        try:
+            # pymodbus keeps the asyncio transport on the transaction
+            # manager (client.ctx); fall back to a top-level attribute in
+            # case a future version moves it back.
+            ctx = getattr(self._endpoint.client, "ctx", None)
+            transport = getattr(ctx, "transport", None) or getattr(
+                self._endpoint.client, "transport", None
+            )
+            sock = transport.get_extra_info("socket") if transport else None
+            if sock is None:
+                log.warning(
+                    "No socket exposed by Modbus client for %s:%d — "
+                    "skipping NODELAY/keepalive tuning",
+                    self.host, self.port,
+                )
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+        except (AttributeError, OSError) as e:
+            log.debug("Could not tune Modbus socket options: %s", e)
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            self._client.close()
-            self._client = None
+        # Hard socket errors invalidate the session; Modbus-level errors
+        # are handled (and counted) inside the read/write helpers.
+        if exc_type is not None and issubclass(exc_type, (ConnectionError, OSError)):
+            self._drop()
+        self._endpoint.lock.release()
         return False
 
+    def close(self):
+        """Release this connection's claim on the shared endpoint.
+
+        The TCP session is only torn down once every connection sharing
+        the (host, port) endpoint has closed — several slave IDs behind
+        one gateway don't lose their socket because one driver shut down.
+        """
+        if self._endpoint.refs > 0:
+            self._endpoint.refs -= 1
+        if self._endpoint.refs == 0:
+            self._drop()
+
     async def read_holding_registers(self, address: int, count: int) -> list[int] | None:
         """Read holding registers (FC3). Returns register values or None on error."""
         try:
-            result = await self._client.read_holding_registers(
+            result = await self._endpoint.client.read_holding_registers(
                 address, count=count, device_id=self.slave_id,
             )
             if result.isError():
                 log.warning("Error reading registers %d-%d: %s", address, address + count, result)
+                self._note_failure()
                 return None
-            return list(result.registers)
+            self._endpoint.consecutive_failures = 0
+            return result.registers
+        except (ConnectionError, OSError) as e:
+            log.error("Connection lost reading registers %d-%d: %s", address, address + count, e)
+            self._drop()
+            return None
         except (ModbusException, Exception) as e:
             log.error("Exception reading registers %d-%d: %s", address, address + count, e)
+            self._note_failure()
             return None
 
     async def write_register(self, address: int, value: int) -> bool:
         """Write a single holding register (FC6). Returns True on success."""
         try:
-            result = await self._client.write_register(
+            result = await self._endpoint.client.write_register(
                 address, value, device_id=self.slave_id,
             )
             if result.isError():
                 log.warning("Error writing register %d=%d: %s", address, value, result)
+                self._note_failure()
                 return False
+            self._endpoint.consecutive_failures = 0
             return True
+        except (ConnectionError, OSError) as e:
+            log.error("Connection lost writing register %d=%d: %s", address, value, e)
+            self._drop()
+            return False
         except (ModbusException, Exception) as e:
             log.error("Exception writing register %d=%d: %s", address, value, e)
+            self._note_failure()
+            return False
+
+    async def write_registers(self, address: int, values: list[int]) -> bool:
+        """Write consecutive holding registers (FC16). Returns True on success.
+
+        One transaction instead of one per register — halves the
+        round-trips for adjacent register pairs like CD1/CD2.
+        """
+        try:
+            result = await self._endpoint.client.write_registers(
+                address, values, device_id=self.slave_id,
+            )
+            if result.isError():
+                log.warning("Error writing registers %d..%d: %s", address, address + len(values) - 1, result)
+                self._note_failure()
+                return False
+            self._endpoint.consecutive_failures = 0
+            return True
+        except (ConnectionError, OSError) as e:
+            log.error("Connection lost writing registers %d..%d: %s", address, address + len(values) - 1, e)
+            self._drop()
+            return False
+        except (ModbusException, Exception) as e:
+            log.error("Exception writing registers %d..%d: %s", address, address + len(values) - 1, e)
+            self._note_failure()
             return False
 
     async def write_register_bits(
@@ -113,12 +335,9 @@ def reg_uint16(registers: list[int], offset: int) -> int:
 def reg_int16(registers: list[int], offset: int) -> int:
     """Extract signed int16 value at offset in register list."""
     raw = registers[offset]
-    return struct.unpack(">h", struct.pack(">H", raw))[0]
+    return raw - 0x10000 if raw >= 0x8000 else raw
 
 
 def reg_uint32(registers: list[int], offset: int) -> int:
     """Extract uint32 from two consecutive registers (big-endian word order)."""
-    high = registers[offset]
-    low = registers[offset + 1]
-    packed = struct.pack(">HH", high, low)
-    return struct.unpack(">I", packed)[0]
+    return (registers[offset] << 16) | registers[offset + 1]
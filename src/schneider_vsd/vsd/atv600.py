@@ -10,7 +10,7 @@ Register addresses/scaling cross-checked against
 
 import asyncio
 import logging
-import time
+from time import monotonic
 
 from ..modbus_client import ModbusTcpConnection, reg_int16, reg_uint16, reg_uint32
 from .base import VsdBase, VsdStatus
@@ -22,7 +22,8 @@ log = logging.getLogger(__name__)
 # Register addresses (0-based Modbus)
 # ---------------------------------------------------------------------------
 
-# Status block — batch read 3200..3274 (75 regs, FC3)
+# Status block — batch read 3200..3245 (46 regs, FC3; trimmed to the
+# last parsed register, RTH high+low word)
 REG_FREQUENCY = 3202        # RFR — output frequency, 0.1 Hz
 REG_CURRENT = 3204          # LCR — motor current, raw / amps_divisor = A
 REG_MAINS_VOLTAGE = 3207    # ULN — mains voltage, 0.1 V
@@ -37,11 +38,11 @@ REG_TFR = 3103              # TFR — max frequency ceiling, 0.1 Hz
 REG_HSP = 3104              # HSP — high speed limit, 0.1 Hz
 REG_LSP = 3105              # LSP — low speed limit, 0.1 Hz
 
-# I/O block — batch read 5200..5249 (50 regs, FC3)
+# I/O block — batch read 5200..5226 (27 regs, FC3; trimmed to AI5I)
 REG_DIGITAL_IN = 5202       # IL1R — logic inputs (bit0=DI1, bit1=DI2, ...)
 REG_AI1_RAW = 5222          # AI1I..AI5I — input physical image, 0..8192 ≡ 0..20mA at 5222..5226
 
-# Config block — batch read 8400..8524 (125 regs, FC3) [unused, retained for parity]
+# Command/reference source configuration (written during setup)
 REG_CHCF = 8401             # I/O control mode
 REG_RCB = 8412              # Reference frequency switching (can't change while running)
 REG_RF1 = 8413              # Reference frequency 1 source
@@ -54,6 +55,15 @@ REG_CD2 = 8424              # Command word 2 source
 REG_CONTROL = 8501          # CMD control word
 REG_SPEED_SET = 8502        # Speed setpoint, Hz * 10
 
+# CMD control-word values under the CHCF=3 I/O profile. Bits 1+2 form the
+# remote-mode latch, bit 0 is RUN, bit 7 is the rising-edge fault reset.
+# Precomposed here so the command paths write named constants instead of
+# re-deriving bit patterns.
+CMD_LATCH_MASK = 0b0000_0110     # bits 1+2 — remote-mode latch
+CMD_REMOTE = 0b0000_0110         # latch asserted, no run
+CMD_REMOTE_RUN = 0b0000_0111     # latch + RUN
+CMD_FAULT_RESET = 0b1000_0110    # latch + bit 7 rising edge
+
 # Setup-only registers
 REG_RSF = 7124              # Fault reset assignment
 REG_TTO = 6005              # Modbus timeout, 0.1 s units (max 300 = 30 s)
@@ -65,6 +75,28 @@ REG_LFT = 7121              # LFT — last error occurred (only read when faulte
 
 NUM_ANALOG_INPUTS = 5       # AI1..AI5
 
+# Offsets of each parsed register within its batched block, folded at
+# import so the per-poll decode is plain indexing — no per-field
+# subtraction on the hot path.
+_STATUS_BASE = 3200
+_IO_BASE = 5200
+_OFS_FREQUENCY = REG_FREQUENCY - _STATUS_BASE
+_OFS_CURRENT = REG_CURRENT - _STATUS_BASE
+_OFS_MAINS_VOLTAGE = REG_MAINS_VOLTAGE - _STATUS_BASE
+_OFS_MOTOR_VOLTAGE = REG_MOTOR_VOLTAGE - _STATUS_BASE
+_OFS_THERMAL_LOAD = REG_THERMAL_LOAD - _STATUS_BASE
+_OFS_POWER_PCT = REG_POWER_PCT - _STATUS_BASE
+_OFS_STATUS = REG_STATUS - _STATUS_BASE
+_OFS_MOTOR_TIME = REG_MOTOR_TIME - _STATUS_BASE
+_OFS_DIGITAL_IN = REG_DIGITAL_IN - _IO_BASE
+_OFS_AI1_RAW = REG_AI1_RAW - _IO_BASE
+
+# Read only up to the last register each block actually parses — the
+# old vsd_control spans (75 and 50 words) carried an unused tail on
+# every poll.
+_STATUS_COUNT = _OFS_MOTOR_TIME + 2          # RTH is a uint32 (2 words)
+_IO_COUNT = _OFS_AI1_RAW + NUM_ANALOG_INPUTS
+
 
 # ---------------------------------------------------------------------------
 # HMIS status word values
@@ -91,8 +123,27 @@ HMIS_STATES = {
     35: "idle",
 }
 
-HMIS_ERROR_STATES = {7, 11, 15, 17, 20, 23, 36}
-HMIS_RUNNING_STATES = {4, 5, 6}
+HMIS_ERROR_STATES = frozenset({7, 11, 15, 17, 20, 23, 36})
+HMIS_RUNNING_STATES = frozenset({4, 5, 6})
+
+
+def _build_hmis_table() -> dict[int, tuple[str, bool, bool, bool, bool]]:
+    """Precompile HMIS code → (name, is_ready, is_running, is_faulted,
+    is_warning) so status decode is a single dict hit per poll instead of
+    several set-membership tests."""
+    table = {}
+    for code in set(HMIS_STATES) | HMIS_ERROR_STATES | HMIS_RUNNING_STATES:
+        table[code] = (
+            HMIS_STATES.get(code, f"unknown_{code}"),
+            code == 2,
+            code in HMIS_RUNNING_STATES,
+            code == 23,
+            code in HMIS_ERROR_STATES and code != 23,
+        )
+    return table
+
+
+_HMIS_TABLE = _build_hmis_table()
 
 FAULT_CODES = {
     0: "No fault",
@@ -118,6 +169,14 @@ FAULT_CODES = {
     96: "Unknown fault",
 }
 
+# Dense LFT code → description table, built once at import. Gaps get a
+# pre-formatted fallback so the faulted-poll path is a bounds check plus
+# one tuple index — no dict hash or f-string per poll.
+_FAULT_TABLE = tuple(
+    FAULT_CODES.get(code, f"Fault code {code}")
+    for code in range(max(FAULT_CODES) + 1)
+)
+
 
 class ATV600(VsdBase):
     """Schneider Altivar ATV600 series VSD driver."""
@@ -132,6 +191,14 @@ class ATV600(VsdBase):
         # can initiate the next start. Fire-once-per-stop via this flag to
         # avoid EEPROM wear on repeated R/WS writes.
         self._remote_latched: bool | None = None
+        self._connection: ModbusTcpConnection | None = None
+        # Short TTL over the last successful status read — absorbs
+        # back-to-back read_status calls within one tick (UI handler +
+        # main loop) without a second round of Modbus transactions.
+        # Command writes invalidate it so callers never act on a snapshot
+        # that predates their own command.
+        self._status_cache_ts: float = 0.0
+        self._status_ttl: float = 0.2
 
     @property
     def config_applied(self) -> bool:
@@ -144,7 +211,18 @@ class ATV600(VsdBase):
         return self._config_applied
 
     def _conn(self) -> ModbusTcpConnection:
-        return ModbusTcpConnection(self.host, self.port, self.slave_id, self.timeout)
+        # One persistent connection per drive — the TCP session survives
+        # across operations and reconnects lazily after errors.
+        if self._connection is None:
+            self._connection = ModbusTcpConnection(
+                self.host, self.port, self.slave_id, self.timeout,
+            )
+        return self._connection
+
+    def _invalidate_status_cache(self) -> None:
+        # Commands change drive state — the next read_status must hit the
+        # wire even if the TTL hasn't lapsed.
+        self._status_cache_ts = 0.0
 
     # ------------------------------------------------------------------
     # Setup
@@ -243,102 +321,64 @@ class ATV600(VsdBase):
     # ------------------------------------------------------------------
 
     async def read_status(self) -> VsdStatus:
-        """Read status, I/O, and config registers.
+        """Read status, I/O, and control registers.
 
-        Three batch reads per the proven polling pattern:
-          1. Status block  3200-3274  (75 regs)
-          2. I/O block     5200-5249  (50 regs)
-          3. Config block  8400-8524  (125 regs)
+        Batch reads per the proven polling pattern:
+          1. Status block  3200-3245  (46 regs)
+          2. I/O block     5200-5226  (27 regs)
+          3. CMD           8501       (1 reg)
 
         When HMIS indicates fault, an additional single read of LFT (7121)
         is issued to resolve the fault code.
 
         All via FC3 (read holding registers).
         """
+        if (
+            self._last_status is not None
+            and self._last_status.contactable
+            and monotonic() - self._status_cache_ts < self._status_ttl
+        ):
+            return self._last_status
+
         status = VsdStatus()
         try:
-            async with self._conn() as conn:
-                status_regs = await conn.read_holding_registers(3200, 75)
+            # Shared (lock-free) session: polling is read-only, so it can
+            # overlap a command sequence — pymodbus correlates the
+            # in-flight transactions by ID.
+            async with self._conn().shared() as conn:
+                # The four reads are independent — issue them
+                # concurrently so pymodbus queues them back-to-back on the
+                # open socket instead of paying a Python-level turnaround
+                # between each. CMD (8501) tells us whether the remote-mode
+                # latch is currently asserted; the old vsd_control habit of
+                # reading the whole 8400-block (125 words) for that one
+                # register is gone. Speed limits (TFR/HSP/LSP) are read
+                # each cycle so the UI can react if an operator changes
+                # LSP on the drive HMI.
+                read = conn.read_holding_registers
+                status_regs, io_regs, cmd_regs, speed_limit_regs = (
+                    await asyncio.gather(
+                        read(3200, _STATUS_COUNT),
+                        read(5200, _IO_COUNT),
+                        read(REG_CONTROL, 1),
+                        read(REG_TFR, 3),
+                    )
+                )
                 if status_regs is None:
                     self._contactable = False
                     return status
 
-                io_regs = await conn.read_holding_registers(5200, 50)
-                # Config block — retained from vsd_control for behavioural
-                # parity. We parse CMD out of it (8501) to tell whether the
-                # remote-mode latch is currently asserted (i.e. whether our
-                # Ethernet channel is actively commanding the drive).
-                config_regs = await conn.read_holding_registers(8400, 125)
-                # Speed limits — TFR/HSP/LSP. Read each cycle so UI can
-                # react if an operator changes LSP on the drive HMI.
-                speed_limit_regs = await conn.read_holding_registers(REG_TFR, 3)
-
                 # Only pay for the LFT read when the drive is signalling a fault.
                 fault_reg = None
-                hmis_peek = reg_uint16(status_regs, REG_STATUS - 3200)
+                hmis_peek = reg_uint16(status_regs, _OFS_STATUS)
                 if hmis_peek == 23:
                     fault_reg = await conn.read_holding_registers(REG_LFT, 1)
 
             self._contactable = True
-            status.contactable = True
-
-            # --- Parse status block (offsets relative to base 3200) ---
-            hmis = reg_uint16(status_regs, REG_STATUS - 3200)
-            status.hmis_state = hmis
-            status.hmis_name = HMIS_STATES.get(hmis, f"unknown_{hmis}")
-            status.is_running = hmis in HMIS_RUNNING_STATES
-            status.is_faulted = hmis == 23
-            status.is_warning = hmis in HMIS_ERROR_STATES and hmis != 23
-            status.is_ready = hmis == 2
-
-            status.frequency_hz = reg_uint16(status_regs, REG_FREQUENCY - 3200) / 10.0
-            status.current_amps = reg_uint16(status_regs, REG_CURRENT - 3200) / self.amps_divisor
-            status.mains_voltage_v = reg_uint16(status_regs, REG_MAINS_VOLTAGE - 3200) / 10.0
-            status.motor_voltage_v = reg_uint16(status_regs, REG_MOTOR_VOLTAGE - 3200)
-            status.thermal_load_pct = reg_uint16(status_regs, REG_THERMAL_LOAD - 3200)
-            status.power_pct = reg_int16(status_regs, REG_POWER_PCT - 3200)
-            status.motor_run_hours = round(
-                reg_uint32(status_regs, REG_MOTOR_TIME - 3200) / 3600.0, 2
-            )
-
-            # --- Parse I/O block ---
-            if io_regs is not None:
-                di = reg_uint16(io_regs, REG_DIGITAL_IN - 5200)
-                status.di_1 = bool(di & 0x01)
-                status.di_2 = bool(di & 0x02)
-                status.di_3 = bool(di & 0x04)
-                # AI1I..AI5I — raw physical image, 0..8192 ≡ 0..20mA.
-                # Engineering conversion (4-20mA, range, units) lives in
-                # downstream config so it isn't dependent on drive-side
-                # AI1J/AI1K/CRL1/CRH1 parameters that operators can change.
-                status.ai_values = [
-                    reg_int16(io_regs, (REG_AI1_RAW - 5200) + i)
-                    for i in range(NUM_ANALOG_INPUTS)
-                ]
-
-            # --- Parse control word ---
-            if config_regs is not None:
-                cw = reg_uint16(config_regs, REG_CONTROL - 8400)
-                status.control_word = cw
-                # Bits 1+2 are the remote-mode latch under CCS=242/CHCF=3.
-                # When set, the drive is listening to our Ethernet CMD and
-                # LFR. When clear, it's following its local command source
-                # (terminals / HMI).
-                status.remote_channel_active = bool(cw & 0b0110)
-
-            # --- Parse speed limits ---
-            if speed_limit_regs is not None:
-                # Layout: [TFR, HSP, LSP] at 3103, 3104, 3105.
-                status.high_speed_hz = reg_uint16(speed_limit_regs, 1) / 10.0
-                status.low_speed_hz = reg_uint16(speed_limit_regs, 2) / 10.0
-
-            # --- Fault code ---
-            if fault_reg:
-                code = fault_reg[0]
-                status.fault_code = code
-                status.fault_description = FAULT_CODES.get(code, f"Fault code {code}")
-
+            self._parse_status(status, status_regs, io_regs, cmd_regs,
+                               speed_limit_regs, fault_reg)
             self._last_status = status
+            self._status_cache_ts = monotonic()
             return status
 
         except Exception as e:
@@ -346,18 +386,95 @@ class ATV600(VsdBase):
             self._contactable = False
             return status
 
+    def _parse_status(self, status, status_regs, io_regs, cmd_regs,
+                      speed_limit_regs, fault_reg) -> None:
+        """Populate ``status`` in place from the raw register blocks.
+
+        One linear pass, no Modbus I/O — called outside the connection
+        context so decode never extends the wire transaction.
+        """
+        status.contactable = True
+
+        # Bind the extraction helpers once — they're hit a dozen-plus
+        # times per poll and LOAD_FAST beats LOAD_GLOBAL on every hit.
+        u16, i16 = reg_uint16, reg_int16
+
+        # --- Parse status block (offsets relative to base 3200) ---
+        hmis = u16(status_regs, _OFS_STATUS)
+        status.hmis_state = hmis
+        decoded = _HMIS_TABLE.get(hmis)
+        if decoded is None:
+            decoded = (f"unknown_{hmis}", False, False, False, False)
+        (status.hmis_name, status.is_ready, status.is_running,
+         status.is_faulted, status.is_warning) = decoded
+
+        status.frequency_hz = u16(status_regs, _OFS_FREQUENCY) / 10.0
+        status.current_amps = u16(status_regs, _OFS_CURRENT) / self.amps_divisor
+        status.mains_voltage_v = u16(status_regs, _OFS_MAINS_VOLTAGE) / 10.0
+        status.motor_voltage_v = u16(status_regs, _OFS_MOTOR_VOLTAGE)
+        status.thermal_load_pct = u16(status_regs, _OFS_THERMAL_LOAD)
+        status.power_pct = i16(status_regs, _OFS_POWER_PCT)
+        status.motor_run_hours = round(
+            reg_uint32(status_regs, _OFS_MOTOR_TIME) / 3600.0, 2
+        )
+
+        # --- Parse I/O block ---
+        if io_regs is not None:
+            di = u16(io_regs, _OFS_DIGITAL_IN)
+            status.di_1 = (di & 0x01) != 0
+            status.di_2 = (di & 0x02) != 0
+            status.di_3 = (di & 0x04) != 0
+            # AI1I..AI5I — raw physical image, 0..8192 ≡ 0..20mA.
+            # Engineering conversion (4-20mA, range, units) lives in
+            # downstream config so it isn't dependent on drive-side
+            # AI1J/AI1K/CRL1/CRH1 parameters that operators can change.
+            status.ai_values = [
+                i16(io_regs, _OFS_AI1_RAW + i)
+                for i in range(NUM_ANALOG_INPUTS)
+            ]
+
+        # --- Parse control word ---
+        if cmd_regs is not None:
+            cw = cmd_regs[0]
+            status.control_word = cw
+            # Bits 1+2 are the remote-mode latch under CCS=242/CHCF=3.
+            # When set, the drive is listening to our Ethernet CMD and
+            # LFR. When clear, it's following its local command source
+            # (terminals / HMI).
+            status.remote_channel_active = (cw & CMD_LATCH_MASK) != 0
+
+        # --- Parse speed limits ---
+        if speed_limit_regs is not None:
+            # Layout: [TFR, HSP, LSP] at 3103, 3104, 3105.
+            status.high_speed_hz = u16(speed_limit_regs, 1) / 10.0
+            status.low_speed_hz = u16(speed_limit_regs, 2) / 10.0
+
+        # --- Fault code ---
+        if fault_reg:
+            code = fault_reg[0]
+            status.fault_code = code
+            if 0 <= code < len(_FAULT_TABLE):
+                status.fault_description = _FAULT_TABLE[code]
+            else:
+                status.fault_description = f"Fault code {code}"
+
     # ------------------------------------------------------------------
     # Motor control
     # ------------------------------------------------------------------
 
-    async def start_motor(self) -> bool:
+    async def start_motor(self, frequency_hz: float | None = None) -> bool:
         """Start the motor with the proven two-step control word sequence.
 
         1. Wait 2 s for other commands to settle
         2. Switch to remote control mode
         3. Write 6 (bits 1+2: remote mode, no run)
         4. Write 7 (bits 0+1+2: remote mode + run)
+
+        When a frequency is supplied, CMD and LFR are adjacent (8501/8502)
+        so the run command and speed reference go out as one FC16 write —
+        the drive never sees RUN latched without a reference.
         """
+        self._invalidate_status_cache()
         try:
             # Drain any pending commands before issuing the start sequence —
             # retained from vsd_control. Blocks the main loop briefly; fine
@@ -367,13 +484,22 @@ class ATV600(VsdBase):
             await asyncio.sleep(0.2)
 
             async with self._conn() as conn:
-                if not await conn.write_register(REG_CONTROL, 6):
+                if not await conn.write_register(REG_CONTROL, CMD_REMOTE):
                     return False
                 await asyncio.sleep(0.2)
-                if not await conn.write_register(REG_CONTROL, 7):
+                if frequency_hz is not None:
+                    frequency_hz = max(
+                        self.min_frequency, min(self.max_frequency, frequency_hz)
+                    )
+                    if not await conn.write_registers(
+                        REG_CONTROL, [CMD_REMOTE_RUN, int(frequency_hz * 10)]
+                    ):
+                        return False
+                    self._last_target_freq = frequency_hz
+                elif not await conn.write_register(REG_CONTROL, CMD_REMOTE_RUN):
                     return False
 
-            self._last_start_time = time.time()
+            self._last_start_time = monotonic()
             log.info("ATV600 start command sent")
             return True
 
@@ -395,9 +521,10 @@ class ATV600(VsdBase):
         call it here because it writes R/WS registers that are rejected
         while the motor is still decelerating.
         """
+        self._invalidate_status_cache()
         try:
             async with self._conn() as conn:
-                if not await conn.write_register(REG_CONTROL, 6):
+                if not await conn.write_register(REG_CONTROL, CMD_REMOTE):
                     return False
             self._remote_latched = True
             log.info("ATV600 stop command sent")
@@ -422,6 +549,7 @@ class ATV600(VsdBase):
         frequency_hz = max(self.min_frequency, min(self.max_frequency, frequency_hz))
         register_value = int(frequency_hz * 10)
 
+        self._invalidate_status_cache()
         try:
             async with self._conn() as conn:
                 if not await conn.write_register(REG_SPEED_SET, register_value):
@@ -452,18 +580,27 @@ class ATV600(VsdBase):
         HMIS read). An even earlier RMW-bit version worked because it
         preserved 1+2 incidentally.
         """
+        self._invalidate_status_cache()
         try:
             async with self._conn() as conn:
-                if not await conn.write_register(REG_CONTROL, 6):
+                if not await conn.write_register(REG_CONTROL, CMD_REMOTE):
                     return False
                 await asyncio.sleep(0.2)
-                if not await conn.write_register(REG_CONTROL, 134):
+                if not await conn.write_register(REG_CONTROL, CMD_FAULT_RESET):
                     return False
-                await asyncio.sleep(0.2)
-                if not await conn.write_register(REG_CONTROL, 6):
+                # Hold bit 7 only as long as the drive needs: poll HMIS in
+                # short steps and drop the edge as soon as the fault state
+                # clears, instead of a fixed worst-case sleep. Capped at
+                # the old fixed delay x2 so a stuck fault can't spin here.
+                for _ in range(8):
+                    await asyncio.sleep(0.05)
+                    hmis_reg = await conn.read_holding_registers(REG_STATUS, 1)
+                    if hmis_reg is not None and hmis_reg[0] != 23:
+                        break
+                if not await conn.write_register(REG_CONTROL, CMD_REMOTE):
                     return False
 
-            self._last_clear_fault_time = time.time()
+            self._last_clear_fault_time = monotonic()
             log.info("ATV600 fault reset sent")
             return True
 
@@ -489,7 +626,7 @@ class ATV600(VsdBase):
 
         # Auto fault recovery with 10 s throttle
         if self._last_status.is_faulted:
-            if time.time() - self._last_clear_fault_time > 10:
+            if monotonic() - self._last_clear_fault_time > 10:
                 log.info("Auto-clearing fault")
                 await self._switch_to_remote()
                 await asyncio.sleep(0.2)
@@ -504,7 +641,7 @@ class ATV600(VsdBase):
         elif not self._last_status.is_running:
             if (self._remote_latched is not False
                     and self._last_status.hmis_state in (2, 3)
-                    and time.time() - self._last_start_time > 2):
+                    and monotonic() - self._last_start_time > 2):
                 await self._set_remote_ready_local()
 
     # ------------------------------------------------------------------
@@ -553,11 +690,11 @@ class ATV600(VsdBase):
 
         try:
             async with self._conn() as conn:
+                # CD1/CD2 are adjacent, so they go out as one FC16 write
                 ok = all([
                     await conn.write_register(REG_RF1, 163),
                     await conn.write_register(REG_RF1B, 171),
-                    await conn.write_register(REG_CD1, 3),
-                    await conn.write_register(REG_CD2, 40),
+                    await conn.write_registers(REG_CD1, [3, 40]),
                 ])
                 if not ok:
                     return False
@@ -588,7 +725,7 @@ class ATV600(VsdBase):
                 ])
                 if not ok:
                     return False
-                return await conn.write_register(REG_CONTROL, 6)
+                return await conn.write_register(REG_CONTROL, CMD_REMOTE)
         except Exception as e:
             log.error("Failed to set terminal mode: %s", e)
             return False
@@ -12,9 +12,14 @@ from dataclasses import dataclass, field
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class VsdStatus:
-    """Snapshot of VSD state from a single poll cycle."""
+    """Snapshot of VSD state from a single poll cycle.
+
+    Slotted — one of these is allocated every poll for the life of the
+    container, and slots keep that allocation dict-free. No code stores
+    ad-hoc attributes on a status snapshot.
+    """
 
     contactable: bool = False
 
@@ -114,8 +119,13 @@ class VsdBase(abc.ABC):
         ...
 
     @abc.abstractmethod
-    async def start_motor(self) -> bool:
-        """Execute the full start sequence (mode switch + start command)."""
+    async def start_motor(self, frequency_hz: float | None = None) -> bool:
+        """Execute the full start sequence (mode switch + start command).
+
+        When ``frequency_hz`` is given, the speed reference is written in
+        the same transaction as the run command rather than as a separate
+        prior write.
+        """
         ...
 
     @abc.abstractmethod
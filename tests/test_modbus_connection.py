@@ -0,0 +1,118 @@
+"""Connection-lifecycle tests for the persistent Modbus wrapper.
+
+The wrapper decides when a TCP session to a live drive gets torn down —
+drop too eagerly and every transient Modbus error costs a handshake,
+drop too lazily and a wedged session stalls polling forever. These tests
+pin the drop/keep rules: the consecutive-failure threshold, the
+reconnect backoff window, and last-one-out teardown of shared endpoints.
+"""
+
+import itertools
+
+import pytest
+
+from schneider_vsd import modbus_client
+from schneider_vsd.modbus_client import ModbusTcpConnection
+
+# Each test gets its own (host, port) key so the module-level endpoint
+# pool never leaks state between tests.
+_PORTS = itertools.count(15500)
+
+
+class _ErrorResult:
+    """Stand-in for a pymodbus exception response."""
+
+    def isError(self):
+        return True
+
+
+class _FakeClient:
+    """Minimal stand-in for AsyncModbusTcpClient on an open session."""
+
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+        self.connected = False
+
+    async def read_holding_registers(self, address, count, device_id):
+        return _ErrorResult()
+
+
+def _connection_with_fake_client():
+    conn = ModbusTcpConnection("127.0.0.1", next(_PORTS), 1)
+    client = _FakeClient()
+    conn._endpoint.client = client
+    return conn, client
+
+
+@pytest.mark.asyncio
+async def test_modbus_errors_below_threshold_keep_session():
+    conn, client = _connection_with_fake_client()
+
+    for _ in range(ModbusTcpConnection.FAILURE_THRESHOLD - 1):
+        assert await conn.read_holding_registers(3200, 1) is None
+
+    assert conn._endpoint.client is client
+    assert not client.closed
+
+
+@pytest.mark.asyncio
+async def test_modbus_errors_at_threshold_drop_session():
+    conn, client = _connection_with_fake_client()
+
+    for _ in range(ModbusTcpConnection.FAILURE_THRESHOLD):
+        assert await conn.read_holding_registers(3200, 1) is None
+
+    assert conn._endpoint.client is None
+    assert client.closed
+    # Counter resets with the drop so the fresh session gets a full budget.
+    assert conn._endpoint.consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_opens_backoff_window(monkeypatch):
+    class _NeverConnects:
+        instances = 0
+
+        def __init__(self, *args, **kwargs):
+            type(self).instances += 1
+            self.connected = False
+
+        async def connect(self):
+            pass
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(modbus_client, "AsyncModbusTcpClient", _NeverConnects)
+    conn = ModbusTcpConnection("127.0.0.1", next(_PORTS), 1)
+
+    with pytest.raises(ConnectionError):
+        await conn._connect()
+    assert conn._endpoint.backoff == ModbusTcpConnection.BACKOFF_INITIAL
+    assert conn._endpoint.next_attempt_ts > modbus_client.monotonic()
+
+    # Inside the window the retry fails fast: no new client is built.
+    with pytest.raises(ConnectionError):
+        await conn._connect()
+    assert _NeverConnects.instances == 1
+
+
+@pytest.mark.asyncio
+async def test_close_tears_down_only_on_last_reference():
+    port = next(_PORTS)
+    first = ModbusTcpConnection("127.0.0.1", port, 1)
+    second = ModbusTcpConnection("127.0.0.1", port, 2)
+    client = _FakeClient()
+    first._endpoint.client = client
+
+    first.close()
+    assert second._endpoint.client is client
+    assert not client.closed
+
+    second.close()
+    assert second._endpoint.client is None
+    assert client.closed
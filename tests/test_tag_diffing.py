@@ -0,0 +1,82 @@
+"""Tag write diffing tests.
+
+`_tag_writes` skips writes whose value matches the last pushed value, so a
+steady-state poll cycle issues zero tag traffic. These tests pin that
+behaviour with a stand-in, same as the notification payload tests.
+"""
+
+import pytest
+
+from schneider_vsd.application import SchneiderVsdApplication
+
+
+class _TagRecorder:
+    def __init__(self, sets):
+        self._sets = sets
+
+    def __getattr__(self, name):
+        sets = self._sets
+
+        class _BoundTag:
+            @staticmethod
+            async def set(value):
+                sets.append((name, value))
+
+        return _BoundTag()
+
+
+class _DiffApp:
+    """Minimal stand-in exposing just what `_tag_writes` touches."""
+
+    def __init__(self):
+        self.sets = []
+        self.tags = _TagRecorder(self.sets)
+        self._pushed_tags = {}
+
+    _tag_writes = SchneiderVsdApplication._tag_writes
+
+
+@pytest.mark.asyncio
+async def test_first_push_writes_everything():
+    app = _DiffApp()
+    writes = app._tag_writes([("vsd_frequency", 42.5), ("vsd_running", True)])
+    for w in writes:
+        await w
+
+    assert app.sets == [("vsd_frequency", 42.5), ("vsd_running", True)]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_values_are_skipped():
+    app = _DiffApp()
+    pairs = [("vsd_frequency", 42.5), ("vsd_running", True)]
+    for w in app._tag_writes(pairs):
+        await w
+    app.sets.clear()
+
+    assert app._tag_writes(pairs) == []
+    assert app.sets == []
+
+
+@pytest.mark.asyncio
+async def test_changed_value_writes_only_that_tag():
+    app = _DiffApp()
+    for w in app._tag_writes([("vsd_frequency", 42.5), ("vsd_running", True)]):
+        await w
+    app.sets.clear()
+
+    for w in app._tag_writes([("vsd_frequency", 43.0), ("vsd_running", True)]):
+        await w
+
+    assert app.sets == [("vsd_frequency", 43.0)]
+
+
+@pytest.mark.asyncio
+async def test_none_is_a_real_value_not_unset():
+    app = _DiffApp()
+    for w in app._tag_writes([("vsd_fault_code", None)]):
+        await w
+    app.sets.clear()
+
+    # A second None push is a no-op, not a re-write.
+    assert app._tag_writes([("vsd_fault_code", None)]) == []